@@ -1,6 +1,7 @@
 import streamlit as st
 import random
-from datetime import datetime
+import time
+from collections import deque
 
 st.set_page_config(
     page_title="Proactive Physical Security & Personalized Deterrence",
@@ -46,6 +47,12 @@ ESCALATION_MAP = {
     "High": "Alert sent to nearest on-duty officer.",
 }
 
+# (event, severity, voice, escalation) per event, resolved once up front
+EVENT_RECORDS = [
+    (e, SEVERITY_MAP[e], VOICE_RESPONSES[SEVERITY_MAP[e]], ESCALATION_MAP[SEVERITY_MAP[e]])
+    for e in EVENTS
+]
+
 # ----------------------------
 # Sidebar Controls
 # ----------------------------
@@ -55,19 +62,23 @@ with st.sidebar:
     st.markdown("Click the button to generate a new event.")
     generate_btn = st.button("🚀 Generate new event")
 
+    st.markdown("---")
+    auto_run = st.checkbox("Auto-run simulation", value=False)
+    speed = st.slider("Seconds between events", min_value=1, max_value=10, value=2)
+
 # ----------------------------
 # State and helpers
 # ----------------------------
 
+# Keep only the most recent events so long auto-run sessions stay bounded
+MAX_LOGS = 500
+
 if "logs" not in st.session_state:
-    st.session_state.logs = []
+    st.session_state.logs = deque(maxlen=MAX_LOGS)
 
 def generate_event():
-    event = random.choice(EVENTS)
-    severity = SEVERITY_MAP[event]
-    voice = VOICE_RESPONSES[severity]
-    escalation = ESCALATION_MAP[severity]
-    ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    event, severity, voice, escalation = random.choice(EVENT_RECORDS)
+    ts = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
 
     st.session_state.logs.append({
         "time": ts,
@@ -77,7 +88,7 @@ def generate_event():
         "escalation": escalation,
     })
 
-def display_latest():
+def display_latest(slot):
     if not st.session_state.logs:
         return
 
@@ -88,28 +99,38 @@ def display_latest():
     escalation = latest["escalation"]
     ts = latest["time"]
 
-    st.subheader(f"1️⃣ Real-Time Surveillance Event Stream")
-    st.write(f"**Latest Event Time:** {ts}")
-    st.write(f"**Detected Behavior:** {event}")
-
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown("### Threat Assessment")
-        if severity == "High":
-            st.error(f"Severity: {severity}")
-        elif severity == "Medium":
-            st.warning(f"Severity: {severity}")
-        else:
-            st.success(f"Severity: {severity}")
-    with col2:
-        st.markdown("### Escalation")
-        if severity == "High":
-            st.error(escalation)
-        else:
-            st.write(escalation)
-
-    st.markdown("### Automated Voice Response")
-    st.info(voice)
+    # One placeholder for the whole card so it is swapped in a single update
+    with slot.container():
+        st.subheader(f"1️⃣ Real-Time Surveillance Event Stream")
+        st.write(f"**Latest Event Time:** {ts}")
+        st.write(f"**Detected Behavior:** {event}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("### Threat Assessment")
+            if severity == "High":
+                st.error(f"Severity: {severity}")
+            elif severity == "Medium":
+                st.warning(f"Severity: {severity}")
+            else:
+                st.success(f"Severity: {severity}")
+        with col2:
+            st.markdown("### Escalation")
+            if severity == "High":
+                st.error(escalation)
+            else:
+                st.write(escalation)
+
+        st.markdown("### Automated Voice Response")
+        st.info(voice)
+
+def display_log():
+    st.markdown("## 2️⃣ Forensic Event Log")
+
+    if st.session_state.logs:
+        st.dataframe(list(st.session_state.logs), use_container_width=True, height=300)
+    else:
+        st.info("No events generated yet.")
 
 # generate one event on first load so it is never empty
 if not st.session_state.logs:
@@ -118,15 +139,26 @@ if not st.session_state.logs:
 if generate_btn:
     generate_event()
 
-display_latest()
-
 # ----------------------------
-# Forensic event log
+# Event stream & forensic event log
 # ----------------------------
 
-st.markdown("## 2️⃣ Forensic Event Log")
+if auto_run:
+    # A full-script run has already handled any button click, so the
+    # fragment's first pass in it must not add an event; only timer ticks do
+    st.session_state.full_run = True
+
+    # Only this fragment reruns on the timer; the sidebar and page stay idle
+    @st.fragment(run_every=f"{speed}s")
+    def live_stream():
+        if st.session_state.full_run:
+            st.session_state.full_run = False
+        else:
+            generate_event()
+        display_latest(st.empty())
+        display_log()
 
-if st.session_state.logs:
-    st.table(st.session_state.logs)
+    live_stream()
 else:
-    st.info("No events generated yet.")
+    display_latest(st.empty())
+    display_log()
@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import re
+from bisect import insort
+import ahocorasick
 
 # -----------------------------
 # Simple Rule-Based Classifier
@@ -45,38 +47,74 @@ MEDIUM_PRIORITY_PATTERNS = [
     r"fraud", r"phishing", r"scam", r"harass", r"stalking"
 ]
 
+# One alternation per tier so each complaint is scanned at most twice
+HIGH_PRIORITY_RE = re.compile("|".join(HIGH_PRIORITY_PATTERNS))
+MEDIUM_PRIORITY_RE = re.compile("|".join(MEDIUM_PRIORITY_PATTERNS))
 
-def classify_crime_type(text: str) -> str:
-    text_l = text.lower()
-    scores = {k: 0 for k in CRIME_KEYWORDS.keys()}
 
-    for crime_type, keywords in CRIME_KEYWORDS.items():
-        for kw in keywords:
-            if kw in text_l:
-                scores[crime_type] += 1
+CRIME_TYPES = list(CRIME_KEYWORDS.keys())
+
+
+@st.cache_resource(show_spinner=False)
+def build_keyword_automaton():
+    """Compile all crime keywords into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for idx, crime_type in enumerate(CRIME_TYPES):
+        for kw in CRIME_KEYWORDS[crime_type]:
+            automaton.add_word(kw, (idx, kw))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = build_keyword_automaton()
+
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def classify_crime_type(text_l: str) -> str:
+    """Classify an already lower-cased complaint."""
+    scores = [0] * len(CRIME_TYPES)
+
+    # Single pass over the text; each keyword counts once, however often it occurs
+    matched = set()
+    for end, (idx, kw) in KEYWORD_AUTOMATON.iter(text_l):
+        start = end - len(kw) + 1
+        # Keywords must start a word ("bank" not in "embankment", "hr" not in
+        # "three") but may be a stem ("threat" in "threatening")
+        if start == 0 or not text_l[start - 1].isalnum():
+            matched.add((idx, kw))
+
+    for idx, _ in matched:
+        scores[idx] += 1
 
     # If everything is zero -> Other / General Cybercrime
-    if all(v == 0 for v in scores.values()):
+    if not any(scores):
         return "Other / General Cybercrime"
 
     # Return crime type with max score
-    return max(scores, key=scores.get)
-
+    return CRIME_TYPES[max(range(len(scores)), key=scores.__getitem__)]
 
-def classify_priority(text: str) -> str:
-    text_l = text.lower()
 
-    for pattern in HIGH_PRIORITY_PATTERNS:
-        if re.search(pattern, text_l):
-            return "High"
+@st.cache_data(max_entries=1024, show_spinner=False)
+def classify_priority(text_l: str) -> str:
+    """Prioritise an already lower-cased complaint."""
+    if HIGH_PRIORITY_RE.search(text_l):
+        return "High"
 
-    for pattern in MEDIUM_PRIORITY_PATTERNS:
-        if re.search(pattern, text_l):
-            return "Medium"
+    if MEDIUM_PRIORITY_RE.search(text_l):
+        return "Medium"
 
     return "Low"
 
 
+# Sort order for the triage queue (High > Medium > Low)
+PRIORITY_ORDER = {"High": 0, "Medium": 1, "Low": 2}
+
+
+def case_sort_key(case: dict) -> tuple:
+    return PRIORITY_ORDER[case["Priority"]], case["Case ID"]
+
+
+@st.cache_data(max_entries=1024, show_spinner=False)
 def suggest_unit(crime_type: str) -> str:
     if "Harassment" in crime_type or "Bullying" in crime_type:
         return "Women’s Safety / Cyber Harassment Cell"
@@ -104,7 +142,7 @@ st.caption(
     "to reduce backlog in government cyber cells."
 )
 
-# Initialize session state for case list
+# Initialize session state for case list (kept sorted by case_sort_key)
 if "cases" not in st.session_state:
     st.session_state.cases = []
 
@@ -153,18 +191,19 @@ with col2:
     st.write("")  # spacing
 
 if add_case and complaint_text.strip():
-    crime_type = classify_crime_type(complaint_text)
-    priority = classify_priority(complaint_text)
+    text_l = complaint_text.lower()
+    crime_type = classify_crime_type(text_l)
+    priority = classify_priority(text_l)
     unit = suggest_unit(crime_type)
 
     case_id = len(st.session_state.cases) + 1
-    st.session_state.cases.append({
+    insort(st.session_state.cases, {
         "Case ID": f"C-{case_id:03d}",
         "Complaint": complaint_text.strip(),
         "Crime Type": crime_type,
         "Priority": priority,
         "Suggested Unit": unit,
-    })
+    }, key=case_sort_key)
     st.success(f"Case added and classified as **{crime_type}** (Priority: **{priority}**).")
 
 # Display dashboard
@@ -173,13 +212,9 @@ st.subheader("2️⃣ Triage Dashboard – Prioritised Case View")
 if not st.session_state.cases:
     st.info("No cases yet. Add a complaint above to see the triage dashboard.")
 else:
+    # Cases are inserted in priority order, so no re-sort is needed here
     df = pd.DataFrame(st.session_state.cases)
 
-    # Sort by priority (High > Medium > Low)
-    priority_order = {"High": 0, "Medium": 1, "Low": 2}
-    df["PriorityRank"] = df["Priority"].map(priority_order)
-    df = df.sort_values(by=["PriorityRank", "Case ID"]).drop(columns=["PriorityRank"])
-
     # Summary metrics
     col_a, col_b, col_c = st.columns(3)
     with col_a:
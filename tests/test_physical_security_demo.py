@@ -0,0 +1,32 @@
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP = str(Path(__file__).resolve().parent.parent / "physical_security_demo.py")
+
+
+def start_auto_run():
+    at = AppTest.from_file(APP).run()
+    at.checkbox[0].check().run()
+    assert not at.exception
+    return at
+
+
+def test_generate_click_with_auto_run_adds_one_event():
+    at = start_auto_run()
+    before = len(at.session_state.logs)
+
+    at.button[0].click().run()
+
+    assert not at.exception
+    assert len(at.session_state.logs) == before + 1
+
+
+def test_interval_change_with_auto_run_adds_no_event():
+    at = start_auto_run()
+    before = len(at.session_state.logs)
+
+    at.slider[0].set_value(5).run()
+
+    assert not at.exception
+    assert len(at.session_state.logs) == before
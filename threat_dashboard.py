@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import random
 from datetime import datetime, timedelta
+from itertools import accumulate
 
 # -----------------------------
 # Helpers to simulate log data
@@ -19,69 +21,182 @@ EVENT_TYPES = [
     "Malware signature detected",
 ]
 
+EVENT_WEIGHTS = [40, 20, 15, 5, 5, 5, 5, 5]  # more "normal" than "attack"
+EVENT_CUM_WEIGHTS = list(accumulate(EVENT_WEIGHTS))
+
 SEVERITY_LEVELS = ["Low", "Medium", "High"]
 
+SEVERITY_MAP = {
+    "Normal traffic": "Low",
+    "User login": "Low",
+    "Failed login": "Medium",
+    "Port scan detected": "Medium",
+    "Unusual data upload": "Medium",
+    "Access from foreign IP": "High",
+    "Multiple failed logins": "High",
+    "Malware signature detected": "High",
+}
+
+DETAILS_MAP = {
+    "Normal traffic": "Regular background network traffic.",
+    "User login": "Successful user login.",
+    "Failed login": "3 consecutive failed logins for user ADMIN from unknown IP.",
+    "Port scan detected": "Multiple ports probed from single IP.",
+    "Unusual data upload": "Outbound traffic spike to external server.",
+    "Access from foreign IP": "Access attempt from foreign IP not seen in last 30 days.",
+    "Multiple failed logins": "10+ failed logins within 1 minute – possible brute-force attack.",
+    "Malware signature detected": "Known malware signature found in HTTP payload.",
+}
+
+EVENT_COLUMNS = [
+    "Timestamp",
+    "Source IP",
+    "Destination IP",
+    "Event Type",
+    "Severity",
+    "Details",
+]
+
+# Only the most recent events are kept in the session
+MAX_EVENTS = 500
+
+# Stored alongside each event; "Time (min)" is formatted once at generation
+STORED_COLUMNS = EVENT_COLUMNS + ["Time (min)"]
+
+
+# IPs are kept packed into a single uint32 and only formatted for display
+IP_COLUMNS = ["Source IP", "Destination IP"]
+IP_SHIFTS = np.array([24, 16, 8, 0], dtype=np.uint32)
 
-def random_ip():
-    return ".".join(str(random.randint(1, 254)) for _ in range(4))
 
+def random_ip(rng=random) -> int:
+    a, b, c, d = (rng.randint(1, 254) for _ in range(4))
+    return (a << 24) | (b << 16) | (c << 8) | d
 
-def generate_event(base_time: datetime) -> dict:
-    event_type = random.choices(
-        EVENT_TYPES,
-        weights=[40, 20, 15, 5, 5, 5, 5, 5],  # more "normal" than "attack"
-        k=1,
-    )[0]
 
-    if event_type in ["Normal traffic", "User login"]:
-        severity = "Low"
-    elif event_type in [
-        "Failed login",
-        "Port scan detected",
-        "Unusual data upload",
-    ]:
-        severity = "Medium"
-    else:
-        severity = "High"
+def format_ip(ip: int) -> str:
+    ip = int(ip)
+    return ".".join(str((ip >> shift) & 0xFF) for shift in (24, 16, 8, 0))
 
+
+def random_event_types(k: int, rng=random) -> list:
+    return rng.choices(EVENT_TYPES, cum_weights=EVENT_CUM_WEIGHTS, k=k)
+
+
+def generate_event(base_time: datetime, event_type: str, rng=random) -> dict:
     return {
         "Timestamp": base_time,
-        "Source IP": random_ip(),
-        "Destination IP": random_ip(),
+        "Source IP": random_ip(rng),
+        "Destination IP": random_ip(rng),
         "Event Type": event_type,
-        "Severity": severity,
-        "Details": generate_details(event_type),
+        "Severity": SEVERITY_MAP[event_type],
+        "Details": DETAILS_MAP[event_type],
+        "Time (min)": base_time.strftime("%H:%M"),
     }
 
 
-def generate_details(event_type: str) -> str:
-    if event_type == "Failed login":
-        return "3 consecutive failed logins for user ADMIN from unknown IP."
-    if event_type == "Multiple failed logins":
-        return "10+ failed logins within 1 minute – possible brute-force attack."
-    if event_type == "Access from foreign IP":
-        return "Access attempt from foreign IP not seen in last 30 days."
-    if event_type == "Unusual data upload":
-        return "Outbound traffic spike to external server."
-    if event_type == "Port scan detected":
-        return "Multiple ports probed from single IP."
-    if event_type == "Malware signature detected":
-        return "Known malware signature found in HTTP payload."
-    if event_type == "User login":
-        return "Successful user login."
-    return "Regular background network traffic."
-
-
-def init_events():
-    """Initialise some past events for the demo."""
+# Lookup tables indexed by position in EVENT_TYPES, for batch generation
+EVENT_TYPE_ARRAY = np.array(EVENT_TYPES, dtype=object)
+EVENT_SEVERITY_ARRAY = np.array([SEVERITY_MAP[e] for e in EVENT_TYPES], dtype=object)
+EVENT_DETAILS_ARRAY = np.array([DETAILS_MAP[e] for e in EVENT_TYPES], dtype=object)
+EVENT_PROBS = np.array(EVENT_WEIGHTS) / sum(EVENT_WEIGHTS)
+
+
+def pack_ips(octets: np.ndarray) -> np.ndarray:
+    """Pack an (n, 4) array of octets into uint32 IPs."""
+    return (octets.astype(np.uint32) << IP_SHIFTS).sum(axis=1, dtype=np.uint32)
+
+
+def format_ips(ips) -> np.ndarray:
+    """Format packed uint32 IPs as dotted-quad strings."""
+    octets = (np.asarray(ips, dtype=np.uint32)[:, None] >> IP_SHIFTS) & 0xFF
+    parts = octets.astype(str).astype(object)
+    return parts[:, 0] + "." + parts[:, 1] + "." + parts[:, 2] + "." + parts[:, 3]
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def generate_events_batch(n: int, seed: int) -> pd.DataFrame:
+    """Generate n events spaced 5 seconds apart in one vectorised pass.
+
+    The batch is fully determined by (n, seed) and carries offsets rather than
+    timestamps, so it can be cached and reproduced from its seed; use
+    stamp_events to place it in time.
+    """
+    rng = np.random.default_rng(seed)
+
+    idx = rng.choice(len(EVENT_TYPES), size=n, p=EVENT_PROBS)
+    octets = rng.integers(1, 255, size=(2, n, 4))
+
+    return pd.DataFrame({
+        "Offset": pd.to_timedelta(np.arange(n) * 5, unit="s"),
+        "Source IP": pack_ips(octets[0]),
+        "Destination IP": pack_ips(octets[1]),
+        "Event Type": EVENT_TYPE_ARRAY[idx],
+        "Severity": EVENT_SEVERITY_ARRAY[idx],
+        "Details": EVENT_DETAILS_ARRAY[idx],
+    })
+
+
+def stamp_events(batch: pd.DataFrame, base_time: datetime) -> pd.DataFrame:
+    """Turn a generated batch's offsets into timestamps starting at base_time."""
+    timestamps = pd.Timestamp(base_time) + batch["Offset"]
+    return batch.drop(columns=["Offset"]).assign(**{
+        "Timestamp": timestamps,
+        "Time (min)": timestamps.dt.strftime("%H:%M"),
+    })
+
+
+@st.cache_data(ttl="10m", show_spinner=False)
+def init_events(seed: int = 0):
+    """Initialise some past events for the demo (deterministic per seed).
+
+    Events are stored column-wise (one list per field) so the DataFrame can
+    be built straight from the columns.
+    """
+    rng = random.Random(seed)
     now = datetime.utcnow()
-    events = []
-    for i in range(40):
+    events = {col: [] for col in STORED_COLUMNS}
+    # Draw all event types in one call rather than one weighted draw per event
+    event_types = random_event_types(40, rng)
+    for i, event_type in enumerate(event_types):
         t = now - timedelta(minutes=40 - i)
-        events.append(generate_event(t))
+        for col, value in generate_event(t, event_type, rng).items():
+            events[col].append(value)
     return events
 
 
+def events_frame(data) -> pd.DataFrame:
+    """Build a typed events DataFrame (uint32 IPs, categorical severity)."""
+    df = pd.DataFrame(data, columns=STORED_COLUMNS)
+    df[IP_COLUMNS] = df[IP_COLUMNS].astype(np.uint32)
+    df["Severity"] = pd.Categorical(df["Severity"], categories=SEVERITY_LEVELS, ordered=True)
+    return df
+
+
+def summarize_events(df: pd.DataFrame) -> dict:
+    """Compute the summary metrics and per-minute activity for the dashboard."""
+    df_ts = df.copy()
+
+    # Severity is an ordered categorical: Low/Medium/High codes are 0/1/2
+    df_ts["Severity Score"] = df_ts["Severity"].cat.codes + 1
+
+    # Aggregate by minute
+    agg = df_ts.groupby(["Time (min)"]).agg(
+        Events=("Event Type", "count"),
+        AvgSeverity=("Severity Score", "mean"),
+    ).reset_index()
+
+    severity_counts = df["Severity"].value_counts()
+
+    return {
+        "total_events": len(df),
+        "high_alerts": int(severity_counts.get("High", 0)),
+        "medium_alerts": int(severity_counts.get("Medium", 0)),
+        "unique_suspicious_ips": int(df.loc[df["Severity"].eq("High"), "Source IP"].nunique()),
+        "activity": agg,
+    }
+
+
 # -----------------------------
 # Streamlit App
 # -----------------------------
@@ -97,9 +212,16 @@ st.caption(
     "government / enterprise network."
 )
 
-# Initialise session state
-if "events" not in st.session_state:
-    st.session_state.events = init_events()
+# Initialise session state: the events DataFrame is kept across reruns and
+# only rebuilt on reset; new batches are appended to it.
+def set_events(df: pd.DataFrame):
+    st.session_state.df = df
+    st.session_state.summary = summarize_events(df)
+
+
+if "df" not in st.session_state:
+    set_events(events_frame(init_events(0)))
+    st.session_state.batch_seed = 0  # one seed per generated batch
 
 # Sidebar controls
 with st.sidebar:
@@ -115,17 +237,19 @@ with st.sidebar:
     show_only_high = st.checkbox("Show only High severity alerts", value=False)
 
 if reset_btn:
-    st.session_state.events = init_events()
+    set_events(events_frame(init_events(0)))
 
 if generate_btn:
-    base_time = datetime.utcnow()
-    for i in range(num_new):
-        t = base_time + timedelta(seconds=i * 5)
-        st.session_state.events.append(generate_event(t))
-    st.success(f"Generated {num_new} new events.")
+    st.session_state.batch_seed += 1
+    new_events = stamp_events(
+        generate_events_batch(num_new, st.session_state.batch_seed), datetime.utcnow()
+    )
+    combined = pd.concat([st.session_state.df, events_frame(new_events)], ignore_index=True)
+    set_events(combined.iloc[-MAX_EVENTS:].reset_index(drop=True))
+    st.success(f"Generated {num_new} new events (batch seed {st.session_state.batch_seed}).")
 
-# Convert to DataFrame
-df = pd.DataFrame(st.session_state.events)
+df = st.session_state.df
+summary = st.session_state.summary
 
 # Filter if needed
 if show_only_high:
@@ -141,40 +265,23 @@ df_display = df_display.sort_values("Timestamp", ascending=False)
 # -----------------------------
 st.subheader("1️⃣ Network Security Summary")
 
-total_events = len(df)
-high_alerts = (df["Severity"] == "High").sum()
-medium_alerts = (df["Severity"] == "Medium").sum()
-unique_suspicious_ips = df[df["Severity"] == "High"]["Source IP"].nunique()
-
 col1, col2, col3, col4 = st.columns(4)
 with col1:
-    st.metric("Total Events Observed", total_events)
+    st.metric("Total Events Observed", summary["total_events"])
 with col2:
-    st.metric("High Severity Alerts", int(high_alerts))
+    st.metric("High Severity Alerts", summary["high_alerts"])
 with col3:
-    st.metric("Medium Severity Alerts", int(medium_alerts))
+    st.metric("Medium Severity Alerts", summary["medium_alerts"])
 with col4:
-    st.metric("Unique Suspicious Source IPs", int(unique_suspicious_ips))
+    st.metric("Unique Suspicious Source IPs", summary["unique_suspicious_ips"])
 
 # -----------------------------
 # Time Series View
 # -----------------------------
 st.subheader("2️⃣ Activity Over Time (Events by Severity)")
 
-df_ts = df.copy()
-df_ts["Time (min)"] = df_ts["Timestamp"].dt.strftime("%H:%M")
-
-severity_numeric = {"Low": 1, "Medium": 2, "High": 3}
-df_ts["Severity Score"] = df_ts["Severity"].map(severity_numeric)
-
-# Aggregate by minute
-agg = df_ts.groupby(["Time (min)"]).agg(
-    Events=("Event Type", "count"),
-    AvgSeverity=("Severity Score", "mean"),
-).reset_index()
-
 st.line_chart(
-    agg.set_index("Time (min)")[["Events", "AvgSeverity"]],
+    summary["activity"].set_index("Time (min)")[["Events", "AvgSeverity"]],
     use_container_width=True,
 )
 
@@ -197,21 +304,15 @@ else:
         last_event = last_high.iloc[0]
         st.warning(
             f"Most recent HIGH alert: **{last_event['Event Type']}** "
-            f"from **{last_event['Source IP']}** at "
+            f"from **{format_ip(last_event['Source IP'])}** at "
             f"{last_event['Timestamp'].strftime('%Y-%m-%d %H:%M:%S UTC')}."
         )
 
+    for col in IP_COLUMNS:
+        df_display[col] = format_ips(df_display[col])
+
     st.dataframe(
-        df_display[
-            [
-                "Timestamp",
-                "Source IP",
-                "Destination IP",
-                "Event Type",
-                "Severity",
-                "Details",
-            ]
-        ],
+        df_display[EVENT_COLUMNS],
         use_container_width=True,
         height=400,
     )